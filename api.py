@@ -3,17 +3,33 @@ Flask API wrapper for the Cloud Trading Bot
 Provides REST endpoints for the trading bot functionality
 """
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from flask import Flask, jsonify, request
 from flask_cors import CORS
-from backend.bot import run_bot
-from backend.data_collector import fetch_market_data, fetch_market_trends
 from backend.config import get_config
-from backend.optimizer import backtest_strategy, optimize_strategy
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# The bot, data collector and optimizer pull in pandas, yfinance, aiohttp and
+# optuna; they are imported inside the endpoints that need them so the API
+# starts (and answers health checks) without paying for those imports.
+
+# Set up logging. Request threads only enqueue records; the stream handler
+# runs on a background listener thread so slow output never blocks a request.
+# force=True replaces any handlers already on the root logger (e.g. installed
+# by the WSGI server such as gunicorn), which would otherwise make basicConfig
+# a no-op; the API process owns logging.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # full format is applied by the listener
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
@@ -54,7 +70,7 @@ def get_system_status():
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }), 200
     except Exception as e:
-        logger.error(f"Error getting system status: {e}")
+        logger.error("Error getting system status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/system/start', methods=['POST'])
@@ -68,7 +84,7 @@ def start_system():
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }), 200
     except Exception as e:
-        logger.error(f"Error starting system: {e}")
+        logger.error("Error starting system: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/system/stop', methods=['POST'])
@@ -82,7 +98,7 @@ def stop_system():
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }), 200
     except Exception as e:
-        logger.error(f"Error stopping system: {e}")
+        logger.error("Error stopping system: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/status', methods=['GET'])
@@ -97,7 +113,7 @@ def get_status():
             'paper_trading': config['trading'].get('paper_trading', True)
         }), 200
     except Exception as e:
-        logger.error(f"Error getting status: {e}")
+        logger.error("Error getting status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/market-data', methods=['GET'])
@@ -112,6 +128,7 @@ def get_market_data():
         # Remove empty strings from symbols
         symbols = [s.strip() for s in symbols if s.strip()]
         
+        from backend.data_collector import fetch_market_data
         market_data = fetch_market_data(symbols)
         
         # Add timestamp to response
@@ -125,7 +142,7 @@ def get_market_data():
         
         return jsonify(response), 200
     except Exception as e:
-        logger.error(f"Error fetching market data: {e}")
+        logger.error("Error fetching market data: %s", e)
         return jsonify({
             'error': str(e),
             'status': 'error',
@@ -136,6 +153,7 @@ def get_market_data():
 def get_market_trends():
     """Get market trends and indicators"""
     try:
+        from backend.data_collector import fetch_market_trends
         trends = fetch_market_trends()
         return jsonify({
             'timestamp': datetime.utcnow().isoformat() + 'Z',
@@ -143,7 +161,7 @@ def get_market_trends():
             'status': 'success'
         }), 200
     except Exception as e:
-        logger.error(f"Error fetching market trends: {e}")
+        logger.error("Error fetching market trends: %s", e)
         return jsonify({
             'error': str(e),
             'status': 'error',
@@ -155,13 +173,14 @@ def run_trading_bot():
     """Run the trading bot (for testing/manual execution)"""
     try:
         # Run bot in test mode
+        from backend.bot import run_bot
         result = run_bot()
         return jsonify({
             'status': 'completed',
             'message': 'Trading bot executed successfully'
         }), 200
     except Exception as e:
-        logger.error(f"Error running bot: {e}")
+        logger.error("Error running bot: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/config', methods=['GET'])
@@ -180,7 +199,7 @@ def get_configuration():
         }
         return jsonify(safe_config), 200
     except Exception as e:
-        logger.error(f"Error getting configuration: {e}")
+        logger.error("Error getting configuration: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # Job status tracking (in production, use Redis or database)
@@ -198,7 +217,7 @@ def get_available_strategies_endpoint():
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }), 200
     except Exception as e:
-        logger.error(f"Error getting strategies: {e}")
+        logger.error("Error getting strategies: %s", e)
         return jsonify({
             'error': str(e),
             'status': 'error',
@@ -218,7 +237,7 @@ def get_strategy_parameter_space_endpoint(strategy_name):
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }), 200
     except Exception as e:
-        logger.error(f"Error getting parameter space for {strategy_name}: {e}")
+        logger.error("Error getting parameter space for %s: %s", strategy_name, e)
         return jsonify({
             'error': str(e),
             'status': 'error',
@@ -239,6 +258,8 @@ def start_backtest():
         
         # Get market data
         symbols = config.get('symbols', ['AAPL', 'GOOGL', 'MSFT'])
+        from backend.data_collector import fetch_market_data
+        from backend.optimizer import backtest_strategy
         market_data = fetch_market_data(symbols)
         
         # Start backtest (in production, run asynchronously)
@@ -260,7 +281,7 @@ def start_backtest():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error starting backtest: {e}")
+        logger.error("Error starting backtest: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/backtest/status/<job_id>', methods=['GET'])
@@ -281,7 +302,7 @@ def get_backtest_status(job_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting backtest status: {e}")
+        logger.error("Error getting backtest status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/backtest/results/<job_id>', methods=['GET'])
@@ -303,7 +324,7 @@ def get_backtest_results(job_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting backtest results: {e}")
+        logger.error("Error getting backtest results: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/optimization/start', methods=['POST'])
@@ -320,6 +341,8 @@ def start_optimization():
         
         # Get market data
         symbols = config.get('symbols', ['AAPL', 'GOOGL', 'MSFT'])
+        from backend.data_collector import fetch_market_data
+        from backend.optimizer import optimize_strategy
         market_data = fetch_market_data(symbols)
         
         # Start optimization (in production, run asynchronously)
@@ -342,7 +365,7 @@ def start_optimization():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error starting optimization: {e}")
+        logger.error("Error starting optimization: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/optimization/status/<job_id>', methods=['GET'])
@@ -364,7 +387,7 @@ def get_optimization_status(job_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting optimization status: {e}")
+        logger.error("Error getting optimization status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/optimization/results/<job_id>', methods=['GET'])
@@ -386,7 +409,7 @@ def get_optimization_results(job_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting optimization results: {e}")
+        logger.error("Error getting optimization results: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.errorhandler(404)
@@ -401,5 +424,5 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     debug = os.environ.get('ENVIRONMENT', 'development') == 'development'
     
-    logger.info(f"Starting Cloud Trading Bot API on port {port}")
+    logger.info("Starting Cloud Trading Bot API on port %s", port)
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -18,11 +18,6 @@ from backend.config import get_config
 from backend.decision_engine import DecisionEngine
 from backend.live_data_manager import get_live_market_data_manager
 
-# Set up logging with enhanced format for decision transparency
-logging.basicConfig(
-    level=logging.INFO, 
-    format="%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 def run_bot():
@@ -31,7 +26,7 @@ def run_bot():
     """
     try:
         config = get_config()
-        logger.info(f"Starting ADVANCED trading bot in {config['env']} environment")
+        logger.info("Starting ADVANCED trading bot in %s environment", config['env'])
         logger.info("LIVE DATA ONLY MODE - No mock data allowed")
         
         # Use autonomous stock selection instead of hardcoded symbols
@@ -47,7 +42,7 @@ def run_bot():
             logger.warning("No stocks selected by autonomous scanner, using fallback")
             symbols = ['AAPL', 'MSFT', 'GOOGL']  # Minimal fallback
             
-        logger.info(f"✅ Autonomously selected {len(symbols)} symbols for analysis: {symbols}")
+        logger.info("✅ Autonomously selected %s symbols for analysis: %s", len(symbols), symbols)
         
         # Run comprehensive analysis
         decisions = asyncio.run(run_comprehensive_analysis(symbols))
@@ -65,7 +60,7 @@ def run_bot():
         logger.info("Bot execution completed successfully")
         
     except Exception as e:
-        logger.error(f"Bot execution failed: {e}")
+        logger.error("Bot execution failed: %s", e)
         raise
 
 async def run_comprehensive_analysis(symbols: List[str]) -> Dict[str, Any]:
@@ -96,8 +91,13 @@ async def run_comprehensive_analysis(symbols: List[str]) -> Dict[str, Any]:
         return decisions
         
     except Exception as e:
-        logger.error(f"Error in comprehensive analysis: {e}")
+        logger.error("Error in comprehensive analysis: %s", e)
         raise
+    
+    finally:
+        # run_bot drives each analysis with its own event loop; the manager's
+        # pooled sessions are bound to it and must be closed before it ends
+        await get_live_market_data_manager().close_sessions()
 
 def validate_decision_quality(decisions: Dict[str, Any], data: Dict[str, Any]):
     """
@@ -118,7 +118,7 @@ def validate_decision_quality(decisions: Dict[str, Any], data: Dict[str, Any]):
         missing_fields = [field for field in required_fields if field not in decision]
         
         if missing_fields:
-            logger.warning(f"{symbol}: Missing decision fields: {missing_fields}")
+            logger.warning("%s: Missing decision fields: %s", symbol, missing_fields)
         
         # Check data freshness if available
         if 'live_data' in symbol_data and 'data_quality' in symbol_data['live_data']:
@@ -126,18 +126,18 @@ def validate_decision_quality(decisions: Dict[str, Any], data: Dict[str, Any]):
             freshness = data_quality.get('freshness', 'unknown')
             
             if freshness in ['stale', 'expired']:
-                logger.warning(f"{symbol}: Using {freshness} data for decisions")
+                logger.warning("%s: Using %s data for decisions", symbol, freshness)
             else:
-                logger.info(f"{symbol}: Using {freshness} data ✓")
+                logger.info("%s: Using %s data ✓", symbol, freshness)
         
         # Check factor transparency
         if 'factors' in decision and len(decision['factors']) > 0:
-            logger.info(f"{symbol}: Decision based on {len(decision['factors'])} factors ✓")
+            logger.info("%s: Decision based on %s factors ✓", symbol, len(decision['factors']))
             
             for factor in decision['factors'][:3]:  # Log first 3 factors
-                logger.debug(f"  - {factor['name']}: {factor['signal']} (confidence: {factor['confidence']:.2f})")
+                logger.debug("  - %s: %s (confidence: %.2f)", factor['name'], factor['signal'], factor['confidence'])
         else:
-            logger.warning(f"{symbol}: No decision factors available")
+            logger.warning("%s: No decision factors available", symbol)
 
 def display_trading_decisions(decisions: Dict[str, Any]):
     """
@@ -209,37 +209,45 @@ def execute_trading_decisions(decisions: Dict[str, Any], config: Dict[str, Any])
     """
     logger.info("=== EXECUTING TRADING DECISIONS ===")
     
-    paper_trading = config.get('trading', {}).get('paper_trading', True)
-    initial_capital = config.get('trading', {}).get('initial_capital', 10000)
+    # Read the trading settings once rather than per decision
+    trading_config = config.get('trading', {})
+    paper_trading = trading_config.get('paper_trading', True)
+    initial_capital = trading_config.get('initial_capital', 10000)
+    # Only execute high-confidence decisions
+    min_confidence = trading_config.get('min_confidence', 0.6)
     
     logger.info(f"Execution mode: {'Paper Trading' if paper_trading else 'Live Trading'}")
     logger.info(f"Initial capital: ${initial_capital:,.2f}")
     
     executed_trades = []
+    executed_at = datetime.now().isoformat()  # one timestamp for the whole batch
+    # Checked once so the per-trade lines that need f-string formatting
+    # (thousands separators) are skipped entirely when INFO is disabled
+    info_enabled = logger.isEnabledFor(logging.INFO)
     
     for symbol, decision in decisions.items():
         if 'error' in decision:
-            logger.warning(f"Skipping {symbol} due to decision error: {decision['error']}")
+            logger.warning("Skipping %s due to decision error: %s", symbol, decision['error'])
             continue
         
         signal = decision.get('signal', 'HOLD')
         confidence = decision.get('confidence', 0.0)
         position_size = decision.get('position_size', 0.0)
         
-        # Only execute high-confidence decisions
-        min_confidence = config.get('trading', {}).get('min_confidence', 0.6)
-        
         if confidence < min_confidence:
-            logger.info(f"Skipping {symbol}: Confidence {confidence:.1%} below threshold {min_confidence:.1%}")
+            logger.info("Skipping %s: Confidence %.1f%% below threshold %.1f%%",
+                        symbol, confidence * 100, min_confidence * 100)
             continue
         
         if signal in ['BUY', 'STRONG_BUY'] and position_size > 0:
             trade_amount = initial_capital * position_size
             
             if paper_trading:
-                logger.info(f"PAPER TRADE: BUY ${trade_amount:,.2f} of {symbol}")
+                if info_enabled:
+                    logger.info(f"PAPER TRADE: BUY ${trade_amount:,.2f} of {symbol}")
             else:
-                logger.info(f"LIVE TRADE: BUY ${trade_amount:,.2f} of {symbol}")
+                if info_enabled:
+                    logger.info(f"LIVE TRADE: BUY ${trade_amount:,.2f} of {symbol}")
                 # Here would be actual trade execution logic
             
             executed_trades.append({
@@ -247,27 +255,27 @@ def execute_trading_decisions(decisions: Dict[str, Any], config: Dict[str, Any])
                 'action': 'BUY',
                 'amount': trade_amount,
                 'confidence': confidence,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': executed_at
             })
         
         elif signal in ['SELL', 'STRONG_SELL']:
             if paper_trading:
-                logger.info(f"PAPER TRADE: SELL {symbol}")
+                logger.info("PAPER TRADE: SELL %s", symbol)
             else:
-                logger.info(f"LIVE TRADE: SELL {symbol}")
+                logger.info("LIVE TRADE: SELL %s", symbol)
                 # Here would be actual trade execution logic
             
             executed_trades.append({
                 'symbol': symbol,
                 'action': 'SELL',
                 'confidence': confidence,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': executed_at
             })
     
     if executed_trades:
-        logger.info(f"Executed {len(executed_trades)} trades")
+        logger.info("Executed %s trades", len(executed_trades))
         for trade in executed_trades:
-            logger.info(f"  {trade['action']} {trade['symbol']} (confidence: {trade['confidence']:.1%})")
+            logger.info("  %s %s (confidence: %.1f%%)", trade['action'], trade['symbol'], trade['confidence'] * 100)
     else:
         logger.info("No trades executed (low confidence or HOLD signals)")
 
@@ -277,14 +285,14 @@ def run_simple_bot():
     """
     try:
         config = get_config()
-        logger.info(f"Starting simplified trading bot in {config['env']} environment")
+        logger.info("Starting simplified trading bot in %s environment", config['env'])
         
         # Fetch basic market data (live only)
         logger.info("Fetching live market data...")
         symbols = config['trading']['default_symbols']
         market_data = fetch_market_data(symbols)
         
-        logger.info(f"Successfully fetched data for {len(market_data)} symbols")
+        logger.info("Successfully fetched data for %s symbols", len(market_data))
         
         # Fetch market trends (live only)
         logger.info("Fetching live market trends...")
@@ -316,14 +324,20 @@ def run_simple_bot():
             print(f"Market trend data unavailable: {trends.get('error', 'Unknown error')}")
             
     except Exception as e:
-        logger.error(f"Simple bot execution failed: {e}")
+        logger.error("Simple bot execution failed: %s", e)
         raise
         
         logger.info("Bot execution completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in bot execution: {e}")
+        logger.error("Error in bot execution: %s", e)
         raise
 
 if __name__ == "__main__":
+    # Set up logging with enhanced format for decision transparency; when imported,
+    # the host application (e.g. api.py) owns the logging configuration
+    logging.basicConfig(
+        level=logging.INFO, 
+        format="%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s"
+    )
     run_bot()
\ No newline at end of file
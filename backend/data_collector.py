@@ -61,15 +61,31 @@ def _fetch_direct_live_data(symbols: List[str]) -> Dict[str, Any]:
     """
     market_data = {}
     
+    # Get 1-minute data for freshness, one batched download for all symbols.
+    # group_by='ticker' keys the columns by (symbol, field) even for one symbol;
+    # yfinance upper-cases the tickers, so columns are looked up by symbol.upper().
+    try:
+        bars = yf.download(symbols, period="1d", interval="1m", group_by='ticker',
+                           progress=False, multi_level_index=True)
+    except Exception as e:
+        logger.error(f"Error downloading live data for {symbols}: {e}")
+        raise Exception(f"Failed to fetch live data for {symbols}: {e}")
+    downloaded = set() if bars is None else set(bars.columns.get_level_values(0))
+    # One clock read for the batch: every symbol's bars came from the same download
+    current_time = datetime.now()
+    checked_at = current_time.isoformat()
+    
     for symbol in symbols:
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # Get 1-minute data for freshness
-            hist = ticker.history(period="1d", interval="1m")
-            info = ticker.info
+            ticker_symbol = symbol.upper()
+            if ticker_symbol in downloaded:
+                # Rows are the union of every symbol's bar times; keep this symbol's bars
+                hist = bars[ticker_symbol].dropna(subset=['Close'])
+            else:
+                hist = pd.DataFrame()
             
             if not hist.empty:
+                info = yf.Ticker(symbol).info
                 latest = hist.iloc[-1]
                 
                 # Validate data freshness
@@ -78,7 +94,6 @@ def _fetch_direct_live_data(symbols: List[str]) -> Dict[str, Any]:
                 if latest_timestamp.tzinfo is not None:
                     latest_timestamp = latest_timestamp.replace(tzinfo=None)
                 
-                current_time = datetime.now()
                 age_seconds = (current_time - latest_timestamp).total_seconds()
                 
                 if age_seconds > 300:  # 5 minutes max age
@@ -97,7 +112,7 @@ def _fetch_direct_live_data(symbols: List[str]) -> Dict[str, Any]:
                     "data_quality": {
                         'freshness': 'fresh' if age_seconds < 300 else 'stale',
                         'source': 'yahoo_finance_direct',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': checked_at
                     }
                 }
             else:
@@ -446,14 +446,15 @@ class TechnicalAnalyzer:
             return None
         
         try:
-            # Calculate RSI
-            closes = data['Close'].astype(float)
-            delta = closes.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
+            # Calculate RSI from the last 14 price changes only. The first bar has
+            # no change (NaN), and NaN changes count as zero gain/loss.
+            closes = data['Close'].to_numpy(dtype=float)[-15:]
+            delta = np.diff(closes, prepend=np.nan)[-14:]
+            gain = np.where(delta > 0, delta, 0).mean()
+            loss = np.where(delta < 0, -delta, 0).mean()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = gain / loss
+            current_rsi = 100 - (100 / (1 + rs))
             
             # Determine signal based on RSI value
             if current_rsi > 70:
@@ -489,13 +490,13 @@ class TechnicalAnalyzer:
             return None
         
         try:
-            closes = data['Close'].astype(float)
-            ma_20 = closes.rolling(window=20).mean()
-            ma_50 = closes.rolling(window=50).mean()
-            
-            current_price = closes.iloc[-1]
-            current_ma20 = ma_20.iloc[-1]
-            current_ma50 = ma_50.iloc[-1]
+            # Only the latest two values of each MA are used; average the tails directly
+            closes = data['Close'].to_numpy(dtype=float)[-51:]
+            current_price = closes[-1]
+            current_ma20 = closes[-20:].mean()
+            prev_ma20 = closes[-21:-1].mean()
+            current_ma50 = closes[-50:].mean()
+            prev_ma50 = closes[-51:-1].mean() if len(closes) > 50 else np.nan
             
             # Determine signal based on price relative to MAs and MA crossover
             if current_price > current_ma20 > current_ma50:
@@ -506,11 +507,11 @@ class TechnicalAnalyzer:
                 signal = Signal.SELL
                 confidence = 0.8
                 reasoning = f"Price below both MAs, bearish trend"
-            elif ma_20.iloc[-1] > ma_20.iloc[-2] and ma_20.iloc[-2] <= ma_50.iloc[-2] and ma_20.iloc[-1] > ma_50.iloc[-1]:
+            elif current_ma20 > prev_ma20 and prev_ma20 <= prev_ma50 and current_ma20 > current_ma50:
                 signal = Signal.BUY
                 confidence = 0.9
                 reasoning = f"Golden cross - MA20 crossing above MA50"
-            elif ma_20.iloc[-1] < ma_20.iloc[-2] and ma_20.iloc[-2] >= ma_50.iloc[-2] and ma_20.iloc[-1] < ma_50.iloc[-1]:
+            elif current_ma20 < prev_ma20 and prev_ma20 >= prev_ma50 and current_ma20 < current_ma50:
                 signal = Signal.SELL
                 confidence = 0.9
                 reasoning = f"Death cross - MA20 crossing below MA50"
@@ -596,7 +597,7 @@ class TechnicalAnalyzer:
             volumes = data['Volume'].astype(float)
             prices = data['Close'].astype(float)
             
-            avg_volume = volumes.rolling(window=20).mean().iloc[-1]
+            avg_volume = volumes.to_numpy()[-20:].mean()
             current_volume = volumes.iloc[-1]
             volume_ratio = current_volume / avg_volume
             
@@ -983,9 +984,12 @@ class DecisionEngine:
         try:
             # Volatility risk
             if len(historical_data) >= 20:
-                returns = historical_data['Close'].pct_change().dropna()
-                volatility = returns.std() * np.sqrt(252)  # Annualized volatility
-                risk_score += min(volatility * 2, 1.0) * 0.4  # Cap at 1.0
+                closes = historical_data['Close'].to_numpy(dtype=float)
+                returns = closes[1:] / closes[:-1] - 1
+                returns = returns[~np.isnan(returns)]
+                if returns.size > 1:
+                    volatility = returns.std(ddof=1) * np.sqrt(252)  # Annualized volatility
+                    risk_score += min(volatility * 2, 1.0) * 0.4  # Cap at 1.0
             
             # Volume risk (low volume = higher risk)
             current_volume = market_data.get('volume', 0)
@@ -18,12 +18,14 @@ Features:
 import asyncio
 import aiohttp
 import logging
+import math
+import random
 import time
 import json
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import yfinance as yf
@@ -31,6 +33,8 @@ import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 import threading
+import weakref
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
@@ -78,13 +82,16 @@ class MarketDataPoint:
 class ConnectionMonitor:
     """Monitors and manages connection health for data providers"""
     
-    def __init__(self):
+    def __init__(self, retry_delay: float = 2.0, exponential_backoff: bool = True):
         self.connection_status = {}
         self.error_counts = {}
         self.last_success = {}
         self.recovery_attempts = {}
+        self.next_retry_at = {}  # source -> monotonic time recovery may start
         self.max_errors = 5
-        self.recovery_cooldown = 300  # 5 minutes
+        self.retry_delay = retry_delay
+        self.exponential_backoff = exponential_backoff
+        self.recovery_cooldown = 300  # 5 minutes, upper bound on the backoff
     
     def record_success(self, source: DataSource):
         """Record successful connection"""
@@ -92,35 +99,68 @@ class ConnectionMonitor:
         self.error_counts[source] = 0
         self.last_success[source] = datetime.now()
         self.recovery_attempts[source] = 0
-        logger.debug(f"Successful connection to {source.value}")
+        self.next_retry_at.pop(source, None)
+        logger.debug("Successful connection to %s", source.value)
     
     def record_error(self, source: DataSource, error: Exception):
         """Record connection error"""
         self.error_counts[source] = self.error_counts.get(source, 0) + 1
         self.connection_status[source] = False
         
-        logger.warning(f"Connection error for {source.value}: {error}")
+        logger.warning("Connection error for %s: %s", source.value, error)
         
-        if self.error_counts[source] >= self.max_errors:
-            logger.error(f"Max errors reached for {source.value}, marking as down")
+        if self.is_tripped(source):
+            logger.error("Max errors reached for %s, marking as down", source.value)
+            self.defer(source, self._backoff_delay(source))
+    
+    def _backoff_delay(self, source: DataSource) -> float:
+        """
+        Cooldown before the next recovery attempt.
+        
+        Doubles with each failed recovery attempt, with +/-50% jitter so several
+        workers don't all retry a provider at once. The jittered delay is capped
+        at recovery_cooldown.
+        """
+        delay = self.retry_delay
+        if self.exponential_backoff:
+            # Clamped exponent: the cap is reached long before 2**16 anyway
+            delay *= 2 ** min(self.recovery_attempts.get(source, 0), 16)
+        return min(self.recovery_cooldown, delay * random.uniform(0.5, 1.5))
+    
+    def defer(self, source: DataSource, delay: float):
+        """Hold off recovery attempts for at least delay seconds"""
+        retry_at = time.monotonic() + delay
+        if retry_at > self.next_retry_at.get(source, 0):
+            self.next_retry_at[source] = retry_at
     
     def is_healthy(self, source: DataSource) -> bool:
         """Check if connection is healthy"""
-        return (self.connection_status.get(source, False) and 
-                self.error_counts.get(source, 0) < self.max_errors)
+        return self.connection_status.get(source, False) and not self.is_tripped(source)
     
     def can_retry(self, source: DataSource) -> bool:
         """Check if retry is allowed"""
-        if source not in self.last_success:
-            return True
-        
-        time_since_last = datetime.now() - self.last_success[source]
-        return time_since_last.seconds > self.recovery_cooldown
+        return time.monotonic() >= self.next_retry_at.get(source, 0)
+    
+    def is_tripped(self, source: DataSource) -> bool:
+        """Check if the circuit is open, i.e. max_errors consecutive failures"""
+        return self.error_counts.get(source, 0) >= self.max_errors
     
     def start_recovery(self, source: DataSource):
-        """Start recovery attempt"""
+        """
+        Start recovery attempt
+        
+        Only a probe against a tripped circuit counts as a recovery attempt; a
+        provider that is merely unhealthy (e.g. its last symbol failed) is just
+        tried again, so it does not inflate the backoff for a later trip.
+        """
+        if not self.is_tripped(source):
+            return
+        
         self.recovery_attempts[source] = self.recovery_attempts.get(source, 0) + 1
-        logger.info(f"Starting recovery attempt #{self.recovery_attempts[source]} for {source.value}")
+        logger.info("Starting recovery attempt #%s for %s", self.recovery_attempts[source], source.value)
+        # Half-open: this caller probes the provider; everyone else keeps
+        # skipping it until the probe succeeds or the next cooldown ends
+        self.defer(source, self._backoff_delay(source))
 
 
 class LiveMarketDataManager:
@@ -131,11 +171,38 @@ class LiveMarketDataManager:
     def __init__(self, config_path: str = "market_data_config.json"):
         self.config_path = config_path
         self.config = self._load_config()
-        self.connection_monitor = ConnectionMonitor()
-        self.session_pool = {}
-        self.data_cache = {}
-        self.cache_ttl = 60  # 1 minute TTL for live data
+        fallback_settings = self.config.get('fallback_settings', {})
+        self.connection_monitor = ConnectionMonitor(
+            retry_delay=fallback_settings.get('retry_delay', 2.0),
+            exponential_backoff=fallback_settings.get('exponential_backoff', True)
+        )
+        # event loop -> (connector shared by the loop's sessions, {source: session})
+        self._loop_pools = weakref.WeakKeyDictionary()
+        self._pool_lock = threading.Lock()
+        # LRU-ordered: symbol -> (monotonic expiry, MarketDataPoint)
+        self.data_cache = OrderedDict()
+        self.cache_ttl = self.config.get('fallback_settings', {}).get('cache_duration', 60)
+        self.cache_max_entries = self.config.get('fallback_settings', {}).get('cache_max_entries', 1000)
+        # symbol -> monotonic expiry for symbols every provider failed on
+        self._neg_cache = {}
+        self.neg_cache_ttl = self.config.get('fallback_settings', {}).get('negative_cache_duration', 30)
+        # symbol -> Future resolved by the coroutine currently fetching it
+        self._inflight = {}
+        # The singleton may be driven from several threads (one asyncio.run per
+        # request thread), so check-then-mutate sequences on the caches hold this
+        self._cache_lock = threading.Lock()
         self.max_concurrent_requests = 10
+        
+        # Providers in failover order, built once: (source, fetch function)
+        provider_settings = self.config.get('providers', {})
+        self.providers: Tuple[Tuple[DataSource, Any], ...] = tuple(sorted(
+            (
+                (DataSource.YAHOO_FINANCE, self._fetch_yahoo_finance_data),
+                (DataSource.ALPHA_VANTAGE, self._fetch_alpha_vantage_data),
+                (DataSource.IEX_CLOUD, self._fetch_iex_cloud_data)
+            ),
+            key=lambda provider: provider_settings.get(provider[0].value, {}).get('priority', 99)
+        ))
         self.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
         # Rate limiting
@@ -144,9 +211,7 @@ class LiveMarketDataManager:
             DataSource.ALPHA_VANTAGE: {"requests": 5, "window": 60, "current": 0, "reset_time": time.time()},
             DataSource.IEX_CLOUD: {"requests": 100, "window": 60, "current": 0, "reset_time": time.time()}
         }
-        
-        # Initialize session pools
-        self._initialize_sessions()
+
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration with live-only enforcement"""
@@ -162,7 +227,7 @@ class LiveMarketDataManager:
             
             return config
         except FileNotFoundError:
-            logger.warning(f"Config file {self.config_path} not found, using defaults")
+            logger.warning("Config file %s not found, using defaults", self.config_path)
             return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
@@ -202,18 +267,54 @@ class LiveMarketDataManager:
             }
         }
     
-    def _initialize_sessions(self):
-        """Initialize HTTP session pools for each provider"""
-        for source in DataSource:
-            self.session_pool[source] = aiohttp.ClientSession(
+    def _get_session(self, source: DataSource) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session for a provider, creating it on first use.
+        
+        Sessions are created lazily inside the running event loop (aiohttp
+        binds them to it) and reused across requests so connections stay warm.
+        All of a loop's sessions share one connector, so keep-alive connections,
+        the DNS cache and the connection limit are pooled across providers.
+        
+        Each event loop gets its own pool, since the manager is a process-wide
+        singleton that several threads may drive with asyncio.run at once.
+        Code that runs the manager under its own loop must await
+        close_sessions() before that loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        with self._pool_lock:
+            connector, sessions = self._loop_pools.get(loop, (None, {}))
+            if connector is None or connector.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_concurrent_requests * 2,
+                    limit_per_host=5,
+                    ttl_dns_cache=300
+                )
+                sessions = {}
+                self._loop_pools[loop] = (connector, sessions)
+        
+        session = sessions.get(source)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
-                connector=aiohttp.TCPConnector(limit=10, limit_per_host=5)
+                connector=connector,
+                connector_owner=False
             )
+            sessions[source] = session
+        return session
     
     async def close_sessions(self):
-        """Close all HTTP sessions"""
-        for session in self.session_pool.values():
-            await session.close()
+        """Close the running event loop's HTTP sessions and shared connector"""
+        with self._pool_lock:
+            connector, sessions = self._loop_pools.pop(asyncio.get_running_loop(), (None, {}))
+        try:
+            for session in sessions.values():
+                await session.close()
+        finally:
+            # Sessions don't own the shared connector, so it is closed here
+            # even if closing a session failed
+            if connector is not None:
+                await connector.close()
     
     def _check_rate_limit(self, source: DataSource) -> bool:
         """Check if request is within rate limits"""
@@ -230,12 +331,29 @@ class LiveMarketDataManager:
         
         # Check if within limits
         if limit_info["current"] >= limit_info["requests"]:
-            logger.warning(f"Rate limit exceeded for {source.value}")
+            logger.warning("Rate limit exceeded for %s", source.value)
             return False
         
         limit_info["current"] += 1
         return True
     
+    def _defer_on_throttle(self, source: DataSource, response: aiohttp.ClientResponse):
+        """Honor a provider's Retry-After header on 429/503 responses"""
+        if response.status not in (429, 503):
+            return
+        try:
+            retry_after = float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            return  # missing, or the HTTP-date form
+        self.connection_monitor.defer(source, retry_after)
+    
+    @staticmethod
+    def _to_naive(timestamp: datetime) -> datetime:
+        """Convert a timezone-aware datetime to naive UTC; naive values pass through"""
+        if timestamp.tzinfo is not None:
+            return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return timestamp
+    
     def _validate_data_freshness(self, data: Dict[str, Any], source: DataSource) -> DataFreshness:
         """Validate data freshness and ensure it's live"""
         try:
@@ -245,16 +363,17 @@ class LiveMarketDataManager:
             # Try to extract timestamp from different possible fields
             for field in ['timestamp', 'time', 'last_updated', 'date']:
                 if field in data:
-                    timestamp = pd.to_datetime(data[field])
-                    # Convert to timezone-naive datetime if it's timezone-aware
-                    if timestamp.tz is not None:
-                        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+                    timestamp = data[field]
+                    # Providers already hand us datetimes; only parse other representations
+                    if not isinstance(timestamp, datetime):
+                        timestamp = pd.to_datetime(timestamp)
+                    timestamp = self._to_naive(timestamp)
                     break
             
             if timestamp is None:
                 # If no timestamp, assume current time (risky but necessary)
                 timestamp = datetime.now()
-                logger.warning(f"No timestamp found in data from {source.value}, assuming current time")
+                logger.warning("No timestamp found in data from %s, assuming current time", source.value)
             
             # Calculate age (ensure both are timezone-naive)
             current_time = datetime.now()
@@ -271,7 +390,7 @@ class LiveMarketDataManager:
                 return DataFreshness.EXPIRED
                 
         except Exception as e:
-            logger.error(f"Error validating data freshness: {e}")
+            logger.error("Error validating data freshness: %s", e)
             return DataFreshness.EXPIRED
     
     def _validate_data_quality(self, data: Dict[str, Any], source: DataSource) -> DataQuality:
@@ -307,56 +426,79 @@ class LiveMarketDataManager:
             error_count=0
         )
     
-    async def _fetch_yahoo_finance_data(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
-        """Fetch live data from Yahoo Finance"""
+    async def _gather_per_symbol(self, source: DataSource, symbols: List[str], fetch_symbol) -> None:
+        """
+        Run a per-symbol fetch coroutine for every symbol with bounded concurrency.
+        
+        Each symbol gets the provider's configured timeout on its own, so one
+        slow symbol is dropped instead of stalling the whole batch.
+        """
+        timeout = self.config.get('providers', {}).get(source.value, {}).get('timeout', 30)
+        # Created per batch: the manager is a process-wide singleton that may be
+        # driven by several event loops, and a semaphore binds to one loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def bounded(symbol: str):
+            async with semaphore:
+                try:
+                    async with asyncio.timeout(timeout):
+                        await fetch_symbol(symbol)
+                except TimeoutError:
+                    logger.error("Timeout fetching %s from %s after %ss", symbol, source.value, timeout)
+                    self.connection_monitor.record_error(source, Exception("Timeout"))
+        
+        await asyncio.gather(*(bounded(symbol) for symbol in symbols))
+    
+    async def _fetch_yahoo_finance_data(self, symbols: List[str],
+                                 results: Optional[Dict[str, MarketDataPoint]] = None) -> Dict[str, MarketDataPoint]:
+        """Fetch live data from Yahoo Finance, adding each symbol to results as it arrives"""
         if not self._check_rate_limit(DataSource.YAHOO_FINANCE):
             raise Exception("Rate limit exceeded for Yahoo Finance")
         
-        results = {}
+        if results is None:
+            results = {}
         
-        try:
-            # Use yfinance for reliable data
-            for symbol in symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
+        async def fetch_symbol(symbol: str):
+            try:
+                # yfinance is blocking, so run it in a worker thread
+                info, hist = await asyncio.to_thread(self._fetch_yahoo_ticker, symbol)
+                
+                if not hist.empty:
+                    latest = hist.iloc[-1]
                     
-                    # Get real-time data
-                    info = ticker.info
-                    hist = ticker.history(period="1d", interval="1m")  # 1-minute intervals for freshness
+                    data = {
+                        'price': float(latest['Close']),
+                        'volume': int(latest['Volume']),
+                        'open': float(latest['Open']),
+                        'high': float(latest['High']),
+                        'low': float(latest['Low']),
+                        'market_cap': info.get('marketCap', 0),
+                        'pe_ratio': info.get('trailingPE', 0),
+                        'timestamp': hist.index[-1].to_pydatetime()
+                    }
                     
-                    if not hist.empty:
-                        latest = hist.iloc[-1]
-                        
-                        data = {
-                            'price': float(latest['Close']),
-                            'volume': int(latest['Volume']),
-                            'open': float(latest['Open']),
-                            'high': float(latest['High']),
-                            'low': float(latest['Low']),
-                            'market_cap': info.get('marketCap', 0),
-                            'pe_ratio': info.get('trailingPE', 0),
-                            'timestamp': hist.index[-1].to_pydatetime()
-                        }
-                        
-                        quality = self._validate_data_quality(data, DataSource.YAHOO_FINANCE)
-                        
-                        # Only accept fresh data
-                        if quality.freshness in [DataFreshness.REAL_TIME, DataFreshness.FRESH]:
-                            results[symbol] = MarketDataPoint(
-                                symbol=symbol,
-                                data=data,
-                                quality=quality,
-                                source=DataSource.YAHOO_FINANCE,
-                                timestamp=datetime.now()
-                            )
-                            self.connection_monitor.record_success(DataSource.YAHOO_FINANCE)
-                        else:
-                            logger.warning(f"Data for {symbol} from Yahoo Finance is not fresh enough: {quality.freshness}")
+                    quality = self._validate_data_quality(data, DataSource.YAHOO_FINANCE)
                     
-                except Exception as e:
-                    logger.error(f"Error fetching {symbol} from Yahoo Finance: {e}")
-                    self.connection_monitor.record_error(DataSource.YAHOO_FINANCE, e)
-                    continue
+                    # Only accept fresh data
+                    if quality.freshness in [DataFreshness.REAL_TIME, DataFreshness.FRESH]:
+                        results[symbol] = MarketDataPoint(
+                            symbol=symbol,
+                            data=data,
+                            quality=quality,
+                            source=DataSource.YAHOO_FINANCE,
+                            timestamp=datetime.now()
+                        )
+                        self.connection_monitor.record_success(DataSource.YAHOO_FINANCE)
+                    else:
+                        logger.warning("Data for %s from Yahoo Finance is not fresh enough: %s", symbol, quality.freshness)
+                
+            except Exception as e:
+                logger.error("Error fetching %s from Yahoo Finance: %s", symbol, e)
+                self.connection_monitor.record_error(DataSource.YAHOO_FINANCE, e)
+        
+        try:
+            # Use yfinance for reliable data, fetching symbols concurrently
+            await self._gather_per_symbol(DataSource.YAHOO_FINANCE, symbols, fetch_symbol)
                     
         except Exception as e:
             self.connection_monitor.record_error(DataSource.YAHOO_FINANCE, e)
@@ -364,8 +506,19 @@ class LiveMarketDataManager:
         
         return results
     
-    async def _fetch_alpha_vantage_data(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
-        """Fetch live data from Alpha Vantage"""
+    @staticmethod
+    def _fetch_yahoo_ticker(symbol: str) -> Tuple[Dict[str, Any], pd.DataFrame]:
+        """Blocking yfinance lookup of ticker info and today's 1-minute bars"""
+        ticker = yf.Ticker(symbol)
+        
+        # Get real-time data
+        info = ticker.info
+        hist = ticker.history(period="1d", interval="1m")  # 1-minute intervals for freshness
+        return info, hist
+    
+    async def _fetch_alpha_vantage_data(self, symbols: List[str],
+                                 results: Optional[Dict[str, MarketDataPoint]] = None) -> Dict[str, MarketDataPoint]:
+        """Fetch live data from Alpha Vantage, adding each symbol to results as it arrives"""
         if not self._check_rate_limit(DataSource.ALPHA_VANTAGE):
             raise Exception("Rate limit exceeded for Alpha Vantage")
         
@@ -374,12 +527,13 @@ class LiveMarketDataManager:
         if api_key == 'demo':
             raise Exception("Alpha Vantage requires a real API key - demo keys not allowed in live mode")
         
-        results = {}
+        if results is None:
+            results = {}
         base_url = "https://www.alphavantage.co/query"
         
-        session = self.session_pool[DataSource.ALPHA_VANTAGE]
+        session = self._get_session(DataSource.ALPHA_VANTAGE)
         
-        for symbol in symbols:
+        async def fetch_symbol(symbol: str):
             try:
                 # Get real-time quote
                 params = {
@@ -418,17 +572,20 @@ class LiveMarketDataManager:
                         else:
                             raise Exception(f"Unexpected response format from Alpha Vantage for {symbol}")
                     else:
+                        self._defer_on_throttle(DataSource.ALPHA_VANTAGE, response)
                         raise Exception(f"HTTP {response.status} from Alpha Vantage for {symbol}")
                         
             except Exception as e:
-                logger.error(f"Error fetching {symbol} from Alpha Vantage: {e}")
+                logger.error("Error fetching %s from Alpha Vantage: %s", symbol, e)
                 self.connection_monitor.record_error(DataSource.ALPHA_VANTAGE, e)
-                continue
+        
+        await self._gather_per_symbol(DataSource.ALPHA_VANTAGE, symbols, fetch_symbol)
         
         return results
     
-    async def _fetch_iex_cloud_data(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
-        """Fetch live data from IEX Cloud"""
+    async def _fetch_iex_cloud_data(self, symbols: List[str],
+                                 results: Optional[Dict[str, MarketDataPoint]] = None) -> Dict[str, MarketDataPoint]:
+        """Fetch live data from IEX Cloud, adding each symbol to results as it arrives"""
         if not self._check_rate_limit(DataSource.IEX_CLOUD):
             raise Exception("Rate limit exceeded for IEX Cloud")
         
@@ -437,12 +594,13 @@ class LiveMarketDataManager:
         if api_key == 'demo':
             raise Exception("IEX Cloud requires a real API key - demo keys not allowed in live mode")
         
-        results = {}
+        if results is None:
+            results = {}
         base_url = "https://cloud.iexapis.com/stable/stock"
         
-        session = self.session_pool[DataSource.IEX_CLOUD]
+        session = self._get_session(DataSource.IEX_CLOUD)
         
-        for symbol in symbols:
+        async def fetch_symbol(symbol: str):
             try:
                 # Get real-time quote
                 url = f"{base_url}/{symbol}/quote"
@@ -475,79 +633,232 @@ class LiveMarketDataManager:
                             )
                             self.connection_monitor.record_success(DataSource.IEX_CLOUD)
                         else:
-                            logger.warning(f"Data for {symbol} from IEX Cloud is not fresh enough: {quality.freshness}")
+                            logger.warning("Data for %s from IEX Cloud is not fresh enough: %s", symbol, quality.freshness)
                     else:
+                        self._defer_on_throttle(DataSource.IEX_CLOUD, response)
                         raise Exception(f"HTTP {response.status} from IEX Cloud for {symbol}")
                         
             except Exception as e:
-                logger.error(f"Error fetching {symbol} from IEX Cloud: {e}")
+                logger.error("Error fetching %s from IEX Cloud: %s", symbol, e)
                 self.connection_monitor.record_error(DataSource.IEX_CLOUD, e)
-                continue
+        
+        await self._gather_per_symbol(DataSource.IEX_CLOUD, symbols, fetch_symbol)
         
         return results
     
-    async def fetch_live_market_data(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
+    def _get_cached_data_point(self, symbol: str, now: float) -> Optional[MarketDataPoint]:
+        """Return the cached data point for a symbol if it has not expired"""
+        with self._cache_lock:
+            entry = self.data_cache.get(symbol)
+            if entry is None:
+                return None
+            
+            expires_at, data_point = entry
+            if expires_at <= now:
+                del self.data_cache[symbol]
+                return None
+            self.data_cache.move_to_end(symbol)
+            return data_point
+    
+    def _cache_data_point(self, symbol: str, data_point: MarketDataPoint,
+                          now: Optional[float] = None, wall_now: Optional[datetime] = None):
         """
-        Fetch live market data with automatic failover and quality validation
+        Cache a freshly fetched data point, evicting LRU entries.
+        
+        The entry lives for cache_ttl seconds, but never past the point where
+        the quote itself would exceed max_data_age_seconds: a quote that was
+        already old when fetched is cached only for the time it has left.
         
         Args:
-            symbols: List of stock symbols to fetch
-            
-        Returns:
-            Dictionary of symbol -> MarketDataPoint with live data only
+            symbol: Stock symbol
+            data_point: Data point to cache
+            now: Monotonic clock reading; batch callers take it once per batch
+            wall_now: Wall-clock reading used to age the quote timestamp
         """
-        if not symbols:
-            raise ValueError("Symbols list cannot be empty")
+        ttl = self.cache_ttl
+        quote_time = data_point.data.get('timestamp')
+        if isinstance(quote_time, datetime):
+            if wall_now is None:
+                wall_now = datetime.now()
+            age_seconds = (wall_now - self._to_naive(quote_time)).total_seconds()
+            ttl = min(ttl, self.config.get('max_data_age_seconds', 300) - age_seconds)
+        if ttl <= 0:
+            return
         
-        # Ensure we're in live-only mode
-        if not self.config.get('live_only_mode', True):
-            raise Exception("Live-only mode is disabled - this violates the requirement for live data only")
+        if now is None:
+            now = time.monotonic()
+        with self._cache_lock:
+            self.data_cache[symbol] = (now + ttl, data_point)
+            self.data_cache.move_to_end(symbol)
+            while len(self.data_cache) > self.cache_max_entries:
+                self.data_cache.popitem(last=False)
+    
+    def invalidate(self, symbol: str):
+        """
+        Drop a symbol's cached quote so the next fetch goes to the providers.
         
-        results = {}
+        Intended for push updates (e.g. a streaming tick or a trade fill) that
+        make the cached quote outdated before its TTL runs out.
+        """
+        with self._cache_lock:
+            self.data_cache.pop(symbol, None)
+            self._neg_cache.pop(symbol, None)
+    
+    def invalidate_all(self):
+        """Drop every cached quote, e.g. at market open/close"""
+        with self._cache_lock:
+            self.data_cache.clear()
+            self._neg_cache.clear()
+    
+    async def _fetch_from_providers(self, symbols: Set[str],
+                                    results: Dict[str, MarketDataPoint]) -> Set[str]:
+        """
+        Fetch symbols from the providers in priority order, failing over on errors
+        
+        Args:
+            symbols: Symbols to fetch
+            results: Dictionary that accepted data points are added to
+            
+        Returns:
+            Symbols that no provider returned fresh data for
+        """
         failed_symbols = set(symbols)
+        # Checked once per batch so the per-symbol loop skips the logging call entirely
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        # Try providers in priority order
-        providers = [
-            (DataSource.YAHOO_FINANCE, self._fetch_yahoo_finance_data),
-            (DataSource.ALPHA_VANTAGE, self._fetch_alpha_vantage_data),
-            (DataSource.IEX_CLOUD, self._fetch_iex_cloud_data)
-        ]
+        connection_monitor = self.connection_monitor
         
-        for source, fetch_func in providers:
+        # Try providers in priority order
+        for source, fetch_func in self.providers:
             if not failed_symbols:
                 break
                 
-            if not self.connection_monitor.is_healthy(source):
-                if self.connection_monitor.can_retry(source):
-                    self.connection_monitor.start_recovery(source)
+            if not connection_monitor.is_healthy(source):
+                if connection_monitor.can_retry(source):
+                    connection_monitor.start_recovery(source)
                 else:
-                    logger.warning(f"Skipping {source.value} - in recovery cooldown")
+                    logger.warning("Skipping %s - in recovery cooldown", source.value)
                     continue
             
+            # The fetcher fills source_results symbol by symbol, so whatever arrived
+            # before a batch timeout is still merged below
+            source_results = {}
+            # Symbols run max_concurrent_requests at a time, each bounded by the
+            # provider timeout, so the batch budget grows with the batch size
+            provider_timeout = self.config.get('providers', {}).get(source.value, {}).get('timeout', 30)
+            batch_timeout = max(30, math.ceil(len(failed_symbols) / self.max_concurrent_requests) * provider_timeout)
             try:
-                logger.info(f"Fetching data for {len(failed_symbols)} symbols from {source.value}")
+                logger.info("Fetching data for %s symbols from %s", len(failed_symbols), source.value)
                 
                 # Fetch data with timeout
-                async with asyncio.timeout(30):
-                    source_results = await fetch_func(list(failed_symbols))
+                async with asyncio.timeout(batch_timeout):
+                    await fetch_func(list(failed_symbols), source_results)
                 
-                # Merge results and update failed symbols
+            except asyncio.TimeoutError:
+                logger.error("Timeout fetching data from %s after %ss, keeping %d results",
+                             source.value, batch_timeout, len(source_results))
+                connection_monitor.record_error(source, Exception("Timeout"))
+            except Exception as e:
+                logger.error("Error fetching data from %s: %s", source.value, e)
+                connection_monitor.record_error(source, e)
+            
+            if source_results:
+                # Merge results and update failed symbols; one clock read per batch
+                fetched_at = time.monotonic()
+                fetched_wall = datetime.now()
                 for symbol, data_point in source_results.items():
                     if data_point.quality.freshness in [DataFreshness.REAL_TIME, DataFreshness.FRESH]:
                         results[symbol] = data_point
                         failed_symbols.discard(symbol)
-                        logger.debug(f"Successfully fetched {symbol} from {source.value}")
+                        self._neg_cache.pop(symbol, None)
+                        self._cache_data_point(symbol, data_point, fetched_at, fetched_wall)
+                        if debug_enabled:
+                            logger.debug("Successfully fetched %s from %s", symbol, source.value)
                     else:
-                        logger.warning(f"Rejected stale data for {symbol} from {source.value}")
-                
-            except asyncio.TimeoutError:
-                logger.error(f"Timeout fetching data from {source.value}")
-                self.connection_monitor.record_error(source, Exception("Timeout"))
-            except Exception as e:
-                logger.error(f"Error fetching data from {source.value}: {e}")
-                self.connection_monitor.record_error(source, e)
+                        logger.warning("Rejected stale data for %s from %s", symbol, source.value)
+        
+        return failed_symbols
+    
+    async def fetch_live_market_data(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
+        """
+        Fetch live market data with automatic failover and quality validation
+        
+        Args:
+            symbols: List of stock symbols to fetch
+            
+        Returns:
+            Dictionary of symbol -> MarketDataPoint with live data only
+        """
+        if not symbols:
+            raise ValueError("Symbols list cannot be empty")
+        
+        # Ensure we're in live-only mode
+        if not self.config.get('live_only_mode', True):
+            raise Exception("Live-only mode is disabled - this violates the requirement for live data only")
+        
+        results = {}
+        
+        # Serve recently fetched quotes from the cache; only misses hit providers
+        now = time.monotonic()
+        for symbol in symbols:
+            cached = self._get_cached_data_point(symbol, now)
+            if cached is not None:
+                results[symbol] = cached
+        failed_symbols = set(symbols).difference(results)
+        
+        # Symbols that recently failed on every provider are not retried until
+        # their negative cache entry expires
+        known_failed = set()
+        with self._cache_lock:
+            for symbol in failed_symbols:
+                expires_at = self._neg_cache.get(symbol)
+                if expires_at is None:
+                    continue
+                if expires_at > now:
+                    known_failed.add(symbol)
+                else:
+                    del self._neg_cache[symbol]
+        if known_failed:
+            failed_symbols -= known_failed
+            logger.debug("Skipping %d recently failed symbols", len(known_failed))
+        
+        # Symbols another coroutine is already fetching are awaited instead of
+        # being requested again; the rest are registered as in flight
+        loop = asyncio.get_running_loop()
+        waiting = {}
+        with self._cache_lock:
+            for symbol in failed_symbols:
+                future = self._inflight.get(symbol)
+                if future is not None and future.get_loop() is loop:
+                    waiting[symbol] = future
+            failed_symbols -= waiting.keys()
+            owned = {symbol: loop.create_future() for symbol in failed_symbols}
+            self._inflight.update(owned)
+        
+        try:
+            failed_symbols = await self._fetch_from_providers(failed_symbols, results)
+        finally:
+            with self._cache_lock:
+                for symbol, future in owned.items():
+                    if self._inflight.get(symbol) is future:
+                        del self._inflight[symbol]
+            for symbol, future in owned.items():
+                future.set_result(results.get(symbol))
+        
+        if waiting:
+            shared = await asyncio.gather(*(asyncio.shield(future) for future in waiting.values()))
+            for symbol, data_point in zip(waiting, shared):
+                if data_point is None:
+                    known_failed.add(symbol)
+                else:
+                    results[symbol] = data_point
         
         # Log results
+        if failed_symbols:
+            expires_at = time.monotonic() + self.neg_cache_ttl
+            for symbol in failed_symbols:
+                self._neg_cache[symbol] = expires_at
+        failed_symbols |= known_failed
         if failed_symbols:
             logger.error(f"Failed to fetch live data for symbols: {failed_symbols}")
             # In live-only mode, we fail completely rather than return partial results
@@ -570,8 +881,8 @@ class LiveMarketDataManager:
             DataFrame with OHLCV data
         """
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period, interval=interval)
+            # yfinance blocks on network I/O; keep it off the event loop
+            hist = await asyncio.to_thread(yf.Ticker(symbol).history, period=period, interval=interval)
             
             if hist.empty:
                 raise Exception(f"No historical data available for {symbol}")
@@ -612,8 +923,8 @@ class LiveMarketDataManager:
             Dictionary with fundamental data
         """
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            # yfinance blocks on network I/O; keep it off the event loop
+            info = await asyncio.to_thread(lambda: yf.Ticker(symbol).info)
             
             # Extract relevant fundamental data
             fundamental_data = {
@@ -728,29 +1039,25 @@ class LiveMarketDataManager:
             'issues': []
         }
         
-        # Test each provider with a simple request
+        # Test each provider with a simple request, probing them concurrently
         test_symbol = 'AAPL'
         healthy_providers = 0
         
-        for source in [DataSource.YAHOO_FINANCE, DataSource.ALPHA_VANTAGE, DataSource.IEX_CLOUD]:
-            try:
-                if source == DataSource.YAHOO_FINANCE:
-                    test_data = await self._fetch_yahoo_finance_data([test_symbol])
-                elif source == DataSource.ALPHA_VANTAGE:
-                    test_data = await self._fetch_alpha_vantage_data([test_symbol])
-                elif source == DataSource.IEX_CLOUD:
-                    test_data = await self._fetch_iex_cloud_data([test_symbol])
-                
-                if test_symbol in test_data:
-                    health_status['providers'][source.value] = 'healthy'
-                    healthy_providers += 1
-                else:
-                    health_status['providers'][source.value] = 'unhealthy'
-                    health_status['issues'].append(f"{source.value}: No data returned")
-                    
-            except Exception as e:
+        probe_results = await asyncio.gather(
+            *(fetch_func([test_symbol]) for _, fetch_func in self.providers),
+            return_exceptions=True
+        )
+        
+        for (source, _), test_data in zip(self.providers, probe_results):
+            if isinstance(test_data, Exception):
                 health_status['providers'][source.value] = 'error'
-                health_status['issues'].append(f"{source.value}: {str(e)}")
+                health_status['issues'].append(f"{source.value}: {str(test_data)}")
+            elif test_symbol in test_data:
+                health_status['providers'][source.value] = 'healthy'
+                healthy_providers += 1
+            else:
+                health_status['providers'][source.value] = 'unhealthy'
+                health_status['issues'].append(f"{source.value}: No data returned")
         
         # Determine overall health
         if healthy_providers == 0:
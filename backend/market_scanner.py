@@ -88,6 +88,7 @@ class MarketScanner:
             'nasdaq100',
             'russell2000'
         ]
+        self.min_request_interval = 0.1  # seconds between stock lookups (rate limit)
         
     def set_criteria(self, criteria: ScannerCriteria):
         """Set scanning criteria"""
@@ -115,8 +116,16 @@ class MarketScanner:
         # Apply screening criteria
         candidates = []
         processed = 0
+        next_request_at = 0.0
         
         for symbol in universe:
+            # Respect rate limits: only wait for whatever part of the interval
+            # the previous lookup has not already used up
+            delay = next_request_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_request_at = time.monotonic() + self.min_request_interval
+            
             try:
                 candidate = self._evaluate_stock(symbol)
                 if candidate:
@@ -125,12 +134,9 @@ class MarketScanner:
                 processed += 1
                 if processed % 50 == 0:
                     logger.info(f"Processed {processed}/{len(universe)} stocks, found {len(candidates)} candidates")
-                    
-                # Respect rate limits
-                time.sleep(0.1)
                 
             except Exception as e:
-                logger.debug(f"Error evaluating {symbol}: {e}")
+                logger.debug("Error evaluating %s: %s", symbol, e)
                 continue
                 
         # Sort by score (highest first)
@@ -282,7 +288,7 @@ class MarketScanner:
             )
             
         except Exception as e:
-            logger.debug(f"Error evaluating {symbol}: {e}")
+            logger.debug("Error evaluating %s: %s", symbol, e)
             return None
             
     def _calculate_score(self, info: Dict, hist: pd.DataFrame) -> float:
@@ -318,9 +324,11 @@ class MarketScanner:
             elif pe > 0:
                 score += 5   # At least positive earnings
                 
-            # Price momentum score (5-day performance)
             if len(hist) >= 5:
-                momentum = (hist['Close'].iloc[-1] / hist['Close'].iloc[-5] - 1) * 100
+                closes = hist['Close'].to_numpy(dtype=float)
+                
+                # Price momentum score (5-day performance)
+                momentum = (closes[-1] / closes[-5] - 1) * 100
                 if momentum > 2:
                     score += 10  # Strong upward momentum
                 elif momentum > 0:
@@ -328,10 +336,10 @@ class MarketScanner:
                 elif momentum > -2:
                     score += 2   # Stable
                     
-            # Volatility score (prefer moderate volatility)
-            if len(hist) >= 5:
-                returns = hist['Close'].pct_change().dropna()
-                volatility = returns.std() * 100
+                # Volatility score (prefer moderate volatility)
+                returns = np.diff(closes) / closes[:-1]
+                returns = returns[~np.isnan(returns)]
+                volatility = returns.std(ddof=1) * 100 if len(returns) > 1 else np.nan
                 if 1 <= volatility <= 3:
                     score += 10  # Moderate volatility
                 elif volatility <= 5:
@@ -343,7 +351,7 @@ class MarketScanner:
                 score += 5
                 
         except Exception as e:
-            logger.debug(f"Error calculating score: {e}")
+            logger.debug("Error calculating score: %s", e)
             
         return max(0, min(100, score))  # Clamp to 0-100
     
@@ -22,12 +22,12 @@ def compute_metrics(trade_results: List[Dict[str, Any]]) -> Dict[str, float]:
         return {"net_profit": 0, "sharpe": 0, "win_rate": 0, "max_drawdown": 0}
     
     try:
-        pnls = [trade.get('pnl', 0) for trade in trade_results]
-        returns = np.array(pnls)
+        returns = np.fromiter((trade.get('pnl', 0) for trade in trade_results),
+                              dtype=float, count=len(trade_results))
         
         # Basic metrics
-        net_profit = sum(returns)
-        win_rate = len([r for r in returns if r > 0]) / len(returns) if returns.size > 0 else 0
+        net_profit = returns.sum()
+        win_rate = np.count_nonzero(returns > 0) / returns.size if returns.size > 0 else 0
         
         # Sharpe ratio (assuming daily returns)
         if returns.std() > 0:
@@ -39,7 +39,7 @@ def compute_metrics(trade_results: List[Dict[str, Any]]) -> Dict[str, float]:
         cumulative_returns = np.cumsum(returns)
         running_max = np.maximum.accumulate(cumulative_returns)
         drawdowns = cumulative_returns - running_max
-        max_drawdown = abs(min(drawdowns)) if len(drawdowns) > 0 else 0
+        max_drawdown = abs(drawdowns.min()) if drawdowns.size > 0 else 0
         
         return {
             "net_profit": float(net_profit),
@@ -69,14 +69,17 @@ def compute_rsi(prices: List[float], period: int = 14) -> float:
         return 50.0  # Neutral RSI
     
     try:
-        prices_array = np.array(prices)
+        # Only the last `period` price changes feed the averages
+        prices_array = np.asarray(prices[-(period + 1):], dtype=float)
         deltas = np.diff(prices_array)
         
+        # np.where (not np.maximum) so a NaN change counts as zero instead of
+        # propagating, matching TechnicalAnalyzer._analyze_rsi
         gains = np.where(deltas > 0, deltas, 0)
         losses = np.where(deltas < 0, -deltas, 0)
         
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
+        avg_gain = gains.mean()
+        avg_loss = losses.mean()
         
         if avg_loss == 0:
             return 100.0
@@ -104,4 +107,25 @@ def compute_moving_average(prices: List[float], period: int) -> float:
     if len(prices) < period:
         return np.mean(prices) if prices else 0.0
     
-    return float(np.mean(prices[-period:]))
\ No newline at end of file
+    return float(np.mean(prices[-period:]))
+
+def compute_moving_average_series(prices: List[float], period: int) -> np.ndarray:
+    """
+    Compute trailing simple moving averages for a whole price series at once.
+    
+    Args:
+        prices: List of price values
+        period: Moving average period
+    
+    Returns:
+        Array where element i is the mean of the ``period`` prices preceding
+        index i (0.0 where fewer than ``period`` prices are available)
+    """
+    prices_array = np.asarray(prices, dtype=float)
+    averages = np.zeros(len(prices_array))
+    if period <= 0 or len(prices_array) < period:
+        return averages
+    
+    cumulative = np.concatenate(([0.0], np.cumsum(prices_array)))
+    averages[period:] = (cumulative[period:-1] - cumulative[:-period - 1]) / period
+    return averages
@@ -9,6 +9,7 @@ import optuna
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
 import logging
+from collections import deque
 from backend.optimizer import backtest_strategy, simulate_price_series
 from backend.optimization.parameter_space import get_parameter_space, TradingParameterSpace
 
@@ -21,17 +22,28 @@ class EnhancedOptimizer:
     more sophisticated trading strategy optimization.
     """
     
-    def __init__(self, parameter_categories: Optional[List[str]] = None):
+    # Objective metric name -> (backtest result section, metric key)
+    OBJECTIVE_METRICS = {
+        'sharpe': ('metrics', 'sharpe'),
+        'return': ('metrics', 'net_profit'),
+        'calmar': ('enhanced_metrics', 'calmar_ratio'),
+        'composite': ('enhanced_metrics', 'composite_score'),
+    }
+    
+    def __init__(self, parameter_categories: Optional[List[str]] = None,
+                 max_history: int = 20):
         """
         Initialize the enhanced optimizer.
         
         Args:
             parameter_categories: List of parameter categories to optimize.
                                 If None, uses all categories.
+            max_history: Number of most recent optimization runs to keep.
+                         Each run holds its full Optuna study.
         """
         self.param_space = get_parameter_space()
         self.parameter_categories = parameter_categories
-        self.optimization_history = []
+        self.optimization_history = deque(maxlen=max_history)
     
     def optimize_strategy(self, 
                          market_data: Dict[str, Any], 
@@ -56,25 +68,31 @@ class EnhancedOptimizer:
             # Use provided categories or instance default
             opt_categories = categories or self.parameter_categories
             
+            # Bind the per-trial callables once; the study config is fixed for the run
+            suggest_parameters = self.param_space.create_optuna_trial_suggest
+            validate_parameters = self.param_space.validate_parameters
+            run_backtest = self._enhanced_backtest
+            calculate_objective = self._calculate_objective
+            
             def objective(trial):
                 # Get parameter suggestions from the parameter space
-                parameters = self.param_space.create_optuna_trial_suggest(trial, opt_categories)
+                parameters = suggest_parameters(trial, opt_categories)
                 
                 # Validate parameters
-                is_valid, errors = self.param_space.validate_parameters(parameters, opt_categories)
+                is_valid, errors = validate_parameters(parameters, opt_categories)
                 if not is_valid:
                     logger.warning(f"Invalid parameters generated: {errors}")
                     return -1000  # Heavy penalty for invalid parameters
                 
                 # Run backtest with the suggested parameters
-                backtest_result = self._enhanced_backtest(market_data, parameters)
+                backtest_result = run_backtest(market_data, parameters)
                 
                 if 'error' in backtest_result:
                     logger.warning(f"Backtest failed: {backtest_result['error']}")
                     return -1000
                 
                 # Calculate objective value based on specified metric
-                return self._calculate_objective(backtest_result, objective_metric)
+                return calculate_objective(backtest_result, objective_metric)
             
             # Create and run Optuna study
             study_kwargs = {
@@ -237,20 +255,13 @@ class EnhancedOptimizer:
             Objective value (higher is better)
         """
         try:
-            base_metrics = backtest_result.get('metrics', {})
-            enhanced_metrics = backtest_result.get('enhanced_metrics', {})
-            
-            if metric == 'sharpe':
-                return base_metrics.get('sharpe', 0)
-            elif metric == 'return':
-                return base_metrics.get('net_profit', 0)
-            elif metric == 'calmar':
-                return enhanced_metrics.get('calmar_ratio', 0)
-            elif metric == 'composite':
-                return enhanced_metrics.get('composite_score', 0)
-            else:
+            source = self.OBJECTIVE_METRICS.get(metric)
+            if source is None:
                 logger.warning(f"Unknown metric: {metric}, defaulting to Sharpe")
-                return base_metrics.get('sharpe', 0)
+                source = self.OBJECTIVE_METRICS['sharpe']
+            
+            result_key, metric_key = source
+            return backtest_result.get(result_key, {}).get(metric_key, 0)
         
         except Exception as e:
             logger.error(f"Error calculating objective for metric {metric}: {e}")
@@ -261,9 +272,9 @@ class EnhancedOptimizer:
         Get the history of optimization runs.
         
         Returns:
-            List of optimization results
+            List of optimization results, oldest first
         """
-        return self.optimization_history
+        return list(self.optimization_history)
     
     def get_parameter_importance(self, study_index: int = -1) -> Dict[str, float]:
         """
@@ -18,6 +18,7 @@ Last Updated: 2025
 import numpy as np
 from typing import Dict, List, Tuple, Union, Any, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 
 
@@ -71,6 +72,7 @@ class TradingParameterSpace:
     def __init__(self):
         """Initialize the parameter space with all trading-related parameters."""
         self.parameters = {}
+        self._flattened_cache = {}  # categories tuple -> flattened definitions
         self._define_rl_ml_parameters()
         self._define_strategy_parameters()
         self._define_feature_engineering_parameters()
@@ -587,14 +589,27 @@ class TradingParameterSpace:
         Returns:
             Dictionary of parameter definitions
         """
-        if categories is None:
-            categories = list(self.parameters.keys())
+        return dict(self._flattened(categories))
+    
+    def _flattened(self, categories: Optional[List[str]] = None) -> Dict[str, ParameterDefinition]:
+        """
+        Get the cached flattened parameter definitions for the given categories.
         
-        result = {}
-        for category in categories:
-            if category in self.parameters:
-                for param_name, param_def in self.parameters[category].items():
-                    result[f"{category}_{param_name}"] = param_def
+        The returned dictionary is shared between calls and must not be mutated.
+        """
+        key = None if categories is None else tuple(categories)
+        result = self._flattened_cache.get(key)
+        if result is None:
+            if categories is None:
+                categories = list(self.parameters.keys())
+            
+            result = {}
+            for category in categories:
+                if category in self.parameters:
+                    for param_name, param_def in self.parameters[category].items():
+                        result[f"{category}_{param_name}"] = param_def
+            
+            self._flattened_cache[key] = result
         
         return result
     
@@ -608,7 +623,7 @@ class TradingParameterSpace:
         Returns:
             Dictionary of default parameter values
         """
-        param_space = self.get_parameter_space(categories)
+        param_space = self._flattened(categories)
         return {name: param_def.default for name, param_def in param_space.items()}
     
     def validate_parameters(self, params: Dict[str, Any], categories: Optional[List[str]] = None) -> Tuple[bool, List[str]]:
@@ -622,7 +637,7 @@ class TradingParameterSpace:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        param_space = self.get_parameter_space(categories)
+        param_space = self._flattened(categories)
         errors = []
         
         for param_name, value in params.items():
@@ -674,7 +689,7 @@ class TradingParameterSpace:
         if seed is not None:
             np.random.seed(seed)
         
-        param_space = self.get_parameter_space(categories)
+        param_space = self._flattened(categories)
         samples = []
         
         for _ in range(n_samples):
@@ -715,7 +730,7 @@ class TradingParameterSpace:
         Returns:
             Dictionary of suggested parameters
         """
-        param_space = self.get_parameter_space(categories)
+        param_space = self._flattened(categories)
         suggestions = {}
         
         for param_name, param_def in param_space.items():
@@ -771,9 +786,14 @@ class TradingParameterSpace:
 
 
 # Convenience function to get the default parameter space instance
+@lru_cache(maxsize=1)
 def get_parameter_space() -> TradingParameterSpace:
     """
-    Get a default instance of the trading parameter space.
+    Get the shared default instance of the trading parameter space.
+    
+    The parameter definitions are static, so the instance is built once and
+    reused by the optimizer and the API helpers. Callers must not mutate it;
+    construct TradingParameterSpace directly for a private copy.
     
     Returns:
         TradingParameterSpace instance with all parameters defined
@@ -5,7 +5,7 @@ import optuna
 import numpy as np
 from typing import Dict, List, Any, Tuple
 import logging
-from backend.metrics import compute_metrics, compute_rsi, compute_moving_average
+from backend.metrics import compute_metrics, compute_rsi, compute_moving_average_series
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +22,14 @@ def backtest_strategy(market_data: Dict[str, Any], parameters: Dict[str, Any]) -
     """
     try:
         trades = []
+        record_trade = trades.append
         position = 0
+        entry_price = 0.0
         cash = parameters.get('initial_capital', 10000)
         
+        short_ma_period = parameters.get('short_ma_period', 5)
+        long_ma_period = parameters.get('long_ma_period', 15)
+        
         # Simple moving average crossover strategy example
         for symbol, data in market_data.items():
             if 'error' in data:
@@ -33,12 +38,13 @@ def backtest_strategy(market_data: Dict[str, Any], parameters: Dict[str, Any]) -
             # Simulate historical prices (in real implementation, use actual historical data)
             prices = simulate_price_series(data['price'], 30)
             
-            short_ma_period = parameters.get('short_ma_period', 5)
-            long_ma_period = parameters.get('long_ma_period', 15)
+            # Compute every trailing average for the series up front
+            short_mas = compute_moving_average_series(prices, short_ma_period).tolist()
+            long_mas = compute_moving_average_series(prices, long_ma_period).tolist()
             
             for i in range(long_ma_period, len(prices)):
-                short_ma = compute_moving_average(prices[i-short_ma_period:i], short_ma_period)
-                long_ma = compute_moving_average(prices[i-long_ma_period:i], long_ma_period)
+                short_ma = short_mas[i]
+                long_ma = long_mas[i]
                 current_price = prices[i]
                 
                 # Buy signal: short MA crosses above long MA
@@ -46,8 +52,9 @@ def backtest_strategy(market_data: Dict[str, Any], parameters: Dict[str, Any]) -
                     shares = cash // current_price
                     if shares > 0:
                         position = shares
+                        entry_price = current_price
                         cash -= shares * current_price
-                        trades.append({
+                        record_trade({
                             'symbol': symbol,
                             'action': 'buy',
                             'price': current_price,
@@ -58,8 +65,8 @@ def backtest_strategy(market_data: Dict[str, Any], parameters: Dict[str, Any]) -
                 # Sell signal: short MA crosses below long MA
                 elif short_ma < long_ma and position > 0:
                     cash += position * current_price
-                    pnl = (current_price - trades[-1]['price']) * position
-                    trades.append({
+                    pnl = (current_price - entry_price) * position
+                    record_trade({
                         'symbol': symbol,
                         'action': 'sell',
                         'price': current_price,
@@ -97,13 +104,17 @@ def simulate_price_series(base_price: float, length: int) -> List[float]:
     """
     np.random.seed(42)  # For reproducible results
     returns = np.random.normal(0.001, 0.02, length)  # Daily returns with drift
-    prices = [base_price]
+    prices = np.empty(length + 1)
+    prices[0] = base_price
+    prices[1:] = base_price * np.cumprod(1 + returns)
     
-    for ret in returns:
-        new_price = prices[-1] * (1 + ret)
-        prices.append(max(new_price, 0.01))  # Prevent negative prices
+    # The floor makes each step depend on the clamped previous price, so only
+    # walk the series step by step when the floor is actually reached
+    if length and prices[1:].min() < 0.01:
+        for i in range(1, length + 1):
+            prices[i] = max(prices[i - 1] * (1 + returns[i - 1]), 0.01)  # Prevent negative prices
     
-    return prices
+    return prices.tolist()
 
 def optimize_strategy(market_data: Dict[str, Any], n_trials: int = 100) -> Dict[str, Any]:
     """
@@ -22,14 +22,19 @@ class PaperTrader:
         self.positions = {}  # symbol -> shares
         self.trades = []
         self.portfolio_history = []
+        # Running per-symbol buy totals so sells don't rescan the trade log
+        self._buy_cost = {}    # symbol -> sum(price * shares) over buys
+        self._buy_shares = {}  # symbol -> sum(shares) over buys
         
     def get_portfolio_value(self, current_prices: Dict[str, float]) -> float:
         """Calculate current portfolio value."""
         portfolio_value = self.cash
         
+        get_price = current_prices.get
         for symbol, shares in self.positions.items():
-            if symbol in current_prices:
-                portfolio_value += shares * current_prices[symbol]
+            price = get_price(symbol)
+            if price is not None:
+                portfolio_value += shares * price
         
         return portfolio_value
     
@@ -48,11 +53,13 @@ class PaperTrader:
         cost = shares * price
         
         if cost > self.cash:
-            logger.warning(f"Insufficient funds to buy {shares} shares of {symbol}")
+            logger.warning("Insufficient funds to buy %s shares of %s", shares, symbol)
             return False
         
         self.cash -= cost
         self.positions[symbol] = self.positions.get(symbol, 0) + shares
+        self._buy_cost[symbol] = self._buy_cost.get(symbol, 0) + cost
+        self._buy_shares[symbol] = self._buy_shares.get(symbol, 0) + shares
         
         trade = {
             'timestamp': datetime.now().isoformat(),
@@ -64,7 +71,7 @@ class PaperTrader:
         }
         
         self.trades.append(trade)
-        logger.info(f"Bought {shares} shares of {symbol} at ${price:.2f}")
+        logger.info("Bought %s shares of %s at $%.2f", shares, symbol, price)
         
         return True
     
@@ -83,7 +90,7 @@ class PaperTrader:
         current_shares = self.positions.get(symbol, 0)
         
         if shares > current_shares:
-            logger.warning(f"Insufficient shares to sell {shares} of {symbol} (have {current_shares})")
+            logger.warning("Insufficient shares to sell %s of %s (have %s)", shares, symbol, current_shares)
             return False
         
         proceeds = shares * price
@@ -94,9 +101,9 @@ class PaperTrader:
             del self.positions[symbol]
         
         # Calculate PnL if we have previous buy trades
-        buy_trades = [t for t in self.trades if t['symbol'] == symbol and t['action'] == 'buy']
-        if buy_trades:
-            avg_buy_price = sum(t['price'] * t['shares'] for t in buy_trades) / sum(t['shares'] for t in buy_trades)
+        bought_shares = self._buy_shares.get(symbol, 0)
+        if bought_shares:
+            avg_buy_price = self._buy_cost[symbol] / bought_shares
             pnl = (price - avg_buy_price) * shares
         else:
             pnl = 0
@@ -112,7 +119,7 @@ class PaperTrader:
         }
         
         self.trades.append(trade)
-        logger.info(f"Sold {shares} shares of {symbol} at ${price:.2f} (PnL: ${pnl:.2f})")
+        logger.info("Sold %s shares of %s at $%.2f (PnL: $%.2f)", shares, symbol, price, pnl)
         
         return True
     
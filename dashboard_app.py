@@ -67,11 +67,12 @@ def generate_mock_data():
     cumulative_returns = np.cumprod(1 + returns)
     portfolio_values = 100000 * cumulative_returns
     
+    # Columns are freshly allocated ndarrays, so let the frame take them as-is
     return pd.DataFrame({
         'date': dates,
         'portfolio_value': portfolio_values,
         'daily_return': returns
-    })
+    }, copy=False)
 
 def main():
     # Header
@@ -80,9 +81,7 @@ def main():
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
-    page = st.sidebar.selectbox("Choose a page", [
-        "Overview", "Live Trading", "Backtest", "Optimization", "Market Data"
-    ])
+    page = st.sidebar.selectbox("Choose a page", list(PAGES))
     
     # API Health Check
     health_data = fetch_api_data("/health")
@@ -92,16 +91,7 @@ def main():
         st.sidebar.error("❌ API Disconnected")
     
     # Main content based on page selection
-    if page == "Overview":
-        show_overview()
-    elif page == "Live Trading":
-        show_live_trading()
-    elif page == "Backtest":
-        show_backtest()
-    elif page == "Optimization":
-        show_optimization()
-    elif page == "Market Data":
-        show_market_data()
+    PAGES[page]()
 
 def show_overview():
     """Display system overview and key metrics"""
@@ -430,5 +420,14 @@ def show_market_data():
     if st.button("🔄 Refresh Data"):
         st.experimental_rerun()
 
+# Page name -> render function, in sidebar order
+PAGES = {
+    "Overview": show_overview,
+    "Live Trading": show_live_trading,
+    "Backtest": show_backtest,
+    "Optimization": show_optimization,
+    "Market Data": show_market_data,
+}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file